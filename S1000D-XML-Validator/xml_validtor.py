@@ -2,21 +2,42 @@
 """
 validate_xml_against_xsd.py
 
-Validate a single XML file against a chosen XSD.
+Validate one or more XML files against a chosen XSD.
 
 Usage:
   # 1) Directly specify both files
   python validate_xml_against_xsd.py --xml /path/to/file.xml --xsd /path/to/schema.xsd
 
+  # Several XML files share one compiled schema
+  python validate_xml_against_xsd.py --xml a.xml b.xml c.xml --xsd /path/to/schema.xsd
+
   # 2) Let the tool list all XSDs in a folder and choose interactively
   python validate_xml_against_xsd.py --xml /path/to/file.xml --xsd-dir /path/to/xsds
 """
 import argparse
+import functools
 import sys
 from pathlib import Path
 from typing import List, Tuple
 from lxml import etree
 
+XS = "http://www.w3.org/2001/XMLSchema"
+
+# Shared, hardened parser for index_xsds. Only the root and its xs:element children
+# are read, so whitespace, comments and ID bookkeeping are dropped to keep the DOM small.
+_XSD_INDEX_PARSER = etree.XMLParser(
+    load_dtd=False, no_network=True, resolve_entities=False,
+    remove_blank_text=True, remove_comments=True, collect_ids=False,
+)
+
+# Shared parser for the XML under validation: no ID hash (XSD validation tracks
+# xs:ID itself), no blank-text nodes, no size limits for large data modules.
+# Entities keep lxml's default (internal only): unexpanded entity references make
+# libxml2's schema validator fail with an internal error.
+_XML_PARSER = etree.XMLParser(
+    collect_ids=False, remove_blank_text=True, huge_tree=True, no_network=True,
+)
+
 
 def index_xsds(xsd_dir: Path) -> List[Tuple[str, Path, str, List[str]]]:
     """
@@ -24,16 +45,13 @@ def index_xsds(xsd_dir: Path) -> List[Tuple[str, Path, str, List[str]]]:
     for each *.xsd file in xsd_dir.
     """
     out: List[Tuple[str, Path, str, List[str]]] = []
-    parser = etree.XMLParser(load_dtd=False, no_network=True, resolve_entities=False)
     for p in sorted(xsd_dir.glob("*.xsd")):
         tns = ""
         elems: List[str] = []
         try:
-            doc = etree.parse(str(p), parser)
-            root = doc.getroot()
+            root = etree.parse(str(p), _XSD_INDEX_PARSER).getroot()
             tns = root.get("targetNamespace", "")
-            XS = "http://www.w3.org/2001/XMLSchema"
-            for el in root.findall(f"{{{XS}}}element"):
+            for el in root.iterchildren(f"{{{XS}}}element"):
                 name = el.get("name")
                 if name:
                     elems.append(name)
@@ -86,27 +104,42 @@ def resolve_xsd_path(xsd_arg: str, xsd_dir: Path | None) -> Path:
     sys.exit(2)
 
 
-def validate(xml_path: Path, xsd_path: Path) -> int:
+@functools.lru_cache(maxsize=32)
+def _compiled_schema(xsd_path: str, mtime: float) -> etree.XMLSchema:
+    """
+    Parse and compile an XSD. Cached per (path, mtime): compiling the large
+    S1000D schemas costs far more than validating a typical data module.
+    """
+    return etree.XMLSchema(etree.parse(xsd_path))
+
+
+def load_schema(xsd_path: Path) -> etree.XMLSchema | None:
     try:
-        xsd_doc = etree.parse(str(xsd_path))
-        schema = etree.XMLSchema(xsd_doc)
+        return _compiled_schema(str(xsd_path), xsd_path.stat().st_mtime)
     except Exception as e:
         print(f"ERROR: Failed to load XSD '{xsd_path}': {e}", file=sys.stderr)
-        return 2
+        return None
+
 
+def validate_with_schema(xml_path: Path, schema: etree.XMLSchema, schema_name: str) -> int:
+    # Parse first, then validate the tree. Validating while parsing
+    # (XMLParser(schema=...) / iterparse(schema=...)) is not a safe shortcut with
+    # libxml2: it misses duplicate xs:ID values, reports errors at line 0, stops at
+    # the first error, and crashes on documents with internal entities unless
+    # entities are left unresolved.
     try:
-        doc = etree.parse(str(xml_path))
+        doc = etree.parse(str(xml_path), _XML_PARSER)
     except Exception as e:
         print(f"[FAIL] Parse error in XML '{xml_path}': {e}")
         return 1
 
     try:
         schema.assertValid(doc)
-        print(f"[ OK ] {xml_path} is valid against {xsd_path.name}")
+        print(f"[ OK ] {xml_path} is valid against {schema_name}")
         return 0
     except etree.DocumentInvalid:
         errors = schema.error_log
-        print(f"[FAIL] Validation failed for {xml_path} against {xsd_path.name}")
+        print(f"[FAIL] Validation failed for {xml_path} against {schema_name}")
         for i, err in enumerate(errors):
             if i > 9:
                 print(f"... and {len(errors)-10} more error(s)")
@@ -118,20 +151,44 @@ def validate(xml_path: Path, xsd_path: Path) -> int:
         return 1
 
 
+def validate(xml_path: Path, xsd_path: Path) -> int:
+    schema = load_schema(xsd_path)
+    if schema is None:
+        return 2
+    return validate_with_schema(xml_path, schema, xsd_path.name)
+
+
+def validate_many(xml_paths: List[Path], xsd_path: Path) -> int:
+    """
+    Validate several XML files against one XSD, compiling the schema once.
+    Returns the worst exit code (0 = all valid, 1 = some invalid, 2 = XSD unusable).
+    """
+    schema = load_schema(xsd_path)
+    if schema is None:
+        return 2
+    rc = 0
+    for xml_path in xml_paths:
+        rc = max(rc, validate_with_schema(xml_path, schema, xsd_path.name))
+    if len(xml_paths) > 1:
+        print(f"{len(xml_paths)} file(s) checked against {xsd_path.name}")
+    return rc
+
+
 def main():
     ap = argparse.ArgumentParser(
-        description="Validate a single XML file against a chosen XSD (direct or interactive)."
+        description="Validate one or more XML files against a chosen XSD (direct or interactive)."
     )
-    ap.add_argument("--xml", required=True, type=Path, help="Path to the XML file to validate.")
+    ap.add_argument("--xml", required=True, type=Path, nargs="+", help="Path(s) to the XML file(s) to validate.")
     ap.add_argument("--xsd", type=str, help="Path or filename of the XSD to use.")
     ap.add_argument("--xsd-dir", type=Path,
                     help="Directory containing XSDs. Required if --xsd is a bare filename or omitted for interactive choice.")
     args = ap.parse_args()
 
-    xml_path = args.xml.resolve()
-    if not xml_path.exists():
-        print(f"ERROR: XML not found: {xml_path}", file=sys.stderr)
-        sys.exit(2)
+    xml_paths = [p.resolve() for p in args.xml]
+    for xml_path in xml_paths:
+        if not xml_path.exists():
+            print(f"ERROR: XML not found: {xml_path}", file=sys.stderr)
+            sys.exit(2)
 
     # Determine XSD path
     if args.xsd:
@@ -149,7 +206,7 @@ def main():
             sys.exit(2)
         xsd_path = choose_schema_interactive(xsd_dir)
 
-    rc = validate(xml_path, xsd_path)
+    rc = validate_many(xml_paths, xsd_path)
     sys.exit(rc)
 
 
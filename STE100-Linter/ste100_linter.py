@@ -6,8 +6,10 @@ import os
 import re
 import sys
 import csv
+import marshal
 import argparse
-from typing import List, Dict, Tuple, Set
+from multiprocessing import Pool
+from typing import List, Dict, Tuple, Set, FrozenSet, Iterable, Iterator, Optional
 # --------- EDIT THIS if your PDF is elsewhere ----------
 PDF_PATH = r"STE100.pdf"
 # -------------------------------------------------------
@@ -23,6 +25,9 @@ def extract_text_from_pdf(pdf_path: str) -> str:
     """
     Try pdfplumber, then PyPDF2, then PyMuPDF (fitz) to read all text from the PDF.
     Install one of them via pip if needed, e.g.: pip install pdfplumber
+    pdfplumber stays first although PyMuPDF is much faster: the dictionary parser
+    (HEADER_SPLIT_RE / HEADWORD_RE) relies on its table layout, and the PyMuPDF
+    output does not contain the "Word  Approved meaning/ STE" table headers.
     """
     text_pages: List[str] = []
 
@@ -76,6 +81,21 @@ def _double_final_consonant_for_ing_ed(w: str) -> bool:
         return False
     return (not _is_vowel(last)) and _is_vowel(w[-2]) and (not _is_vowel(w[-3]))
 
+# Endings that take -ES instead of -S (3rd person singular / plural)
+_ES_ENDINGS_NOUN = ("s", "x", "z", "ch", "sh")
+_ES_ENDINGS_VERB = _ES_ENDINGS_NOUN + ("o",)
+
+def _s_form(b: str, es_endings) -> str:
+    """
+    Add -S / -ES / -IES to an UPPERCASE base: BOX->BOXES, BODY->BODIES, VALVE->VALVES.
+    """
+    low = b.lower()
+    if _ends_with_any(low, es_endings):
+        return b + "ES"
+    if low.endswith("y") and len(b) > 1 and not _is_vowel(b[-2]):
+        return b[:-1] + "IES"
+    return b + "S"
+
 def _verb_inflections(base_upper: str) -> set:
     """
     Generate simple English verb inflections (UPPERCASE):
@@ -87,12 +107,7 @@ def _verb_inflections(base_upper: str) -> set:
     low = b.lower()
 
     # 3rd person singular
-    if _ends_with_any(low, ("s", "x", "z", "ch", "sh", "o")):
-        out.add(b + "ES")
-    elif low.endswith("y") and len(b) > 1 and not _is_vowel(b[-2]):
-        out.add(b[:-1] + "IES")
-    else:
-        out.add(b + "S")
+    out.add(_s_form(b, _ES_ENDINGS_VERB))
 
     # PAST
     if low.endswith("e"):
@@ -118,20 +133,19 @@ def _plural_forms(base_upper: str) -> set:
     """
     Generate simple plural for nouns (UPPERCASE): -S / -ES / -IES.
     """
-    b = base_upper
-    out = {b}
-    low = b.lower()
-    if _ends_with_any(low, ("s", "x", "z", "ch", "sh")):
-        out.add(b + "ES")             # BOX->BOXES
-    elif low.endswith("y") and len(b) > 1 and not _is_vowel(b[-2]):
-        out.add(b[:-1] + "IES")       # BODY->BODIES
-    else:
-        out.add(b + "S")              # VALVE->VALVES
-    return out
+    return {base_upper, _s_form(base_upper, _ES_ENDINGS_NOUN)}
 
 # ---------------------- Build lexicons ----------------------
 HEADWORD_RE = re.compile(r'\n([A-Za-z][A-Za-z0-9\-/ ]{1,})\s*\(([a-zA-Z\. ]+)\)\s')
 HEADER_SPLIT_RE = re.compile(r'Word\s+Approved meaning/?\s+STE', flags=re.IGNORECASE)
+HAS_LETTER_RE = re.compile(r'[A-Za-z]')
+ALLCAPS_RE = re.compile(r"\b[A-Z][A-Z0-9\-]{2,}\b")
+
+# Common headings/labels to ignore in the ALL-CAPS sweep (tune if needed)
+ALLCAPS_IGNORE = frozenset({
+    "WORD","APPROVED","MEANING","ALTERNATIVES","STE","EXAMPLE","NON","PART","SPEECH",
+    "PAGE","ISSUE","DICTIONARY","TABLE","FIGURE","APPENDIX","SECTION","NOTE"
+})
 
 def build_lexicons_from_pdf(pdf_path: str) -> Tuple[Set[str], Set[str]]:
     """
@@ -139,18 +153,26 @@ def build_lexicons_from_pdf(pdf_path: str) -> Tuple[Set[str], Set[str]]:
       approved_words (official approved + verb inflections + noun plurals),
       forbidden_words (official lowercase headwords only).
     """
-    full = extract_text_from_pdf(pdf_path)
-    parts = HEADER_SPLIT_RE.split(full)
+    return build_lexicons_from_text(extract_text_from_pdf(pdf_path))
+
+def build_lexicons_from_text(full: str) -> Tuple[Set[str], Set[str]]:
+    """
+    Same as build_lexicons_from_pdf, on already extracted PDF text.
+    """
+    # Table sections run from the end of one table header to the start of the next.
+    # Scan them in place with pos/endpos instead of copying them out with re.split.
+    headers = list(HEADER_SPLIT_RE.finditer(full))
+    sections = zip([h.end() for h in headers], [h.start() for h in headers[1:]] + [len(full)])
 
     approved_words: Set[str] = set()
     forbidden_words: Set[str] = set()
 
-    for sec in parts[1:]:
-        for m in HEADWORD_RE.finditer(sec):
+    for sec_start, sec_end in sections:
+        for m in HEADWORD_RE.finditer(full, sec_start, sec_end):
             hw = m.group(1).strip()
             pos = m.group(2).strip().lower()
 
-            if not re.search(r'[A-Za-z]', hw):
+            if not HAS_LETTER_RE.search(hw):
                 continue
 
             if hw.upper() == hw and hw.lower() != hw:
@@ -175,16 +197,17 @@ def extract_all_caps_words(pdf_path: str) -> Set[str]:
     Sweep the entire PDF text and take all ALL-CAPS tokens (>=3 chars) as an extra allow-list.
     This helps avoid false 'UnapprovedWord' on words that are capitalized throughout.
     """
-    text = extract_text_from_pdf(pdf_path)
+    return all_caps_words_from_text(extract_text_from_pdf(pdf_path))
+
+def all_caps_words_from_text(text: str) -> Set[str]:
+    """
+    Same as extract_all_caps_words, on already extracted PDF text.
+    """
     words = set()
-    for m in re.findall(r"\b[A-Z][A-Z0-9\-]{2,}\b", text):
+    for m in ALLCAPS_RE.findall(text):
         if m.isdigit():
             continue
-        # Common headings/labels to ignore (tune if needed)
-        if m in {
-            "WORD","APPROVED","MEANING","ALTERNATIVES","STE","EXAMPLE","NON","PART","SPEECH",
-            "PAGE","ISSUE","DICTIONARY","TABLE","FIGURE","APPENDIX","SECTION","NOTE"
-        }:
+        if m in ALLCAPS_IGNORE:
             continue
         words.add(m)
     return words
@@ -208,125 +231,246 @@ def ensure_wordlists(approved_path: str, forbidden_path: str, allcaps_path: str,
         )
 
     print("Wordlists missing — building from PDF (full). This may take a moment...")
-    approved, forbidden = build_lexicons_from_pdf(pdf_path)
-    allcaps = extract_all_caps_words(pdf_path)
-
-    with open(approved_path, "w", encoding="utf-8") as f:
-        for w in sorted(approved):
-            f.write(w + "\n")
-
-    with open(forbidden_path, "w", encoding="utf-8") as f:
-        for w in sorted(forbidden):
-            f.write(w + "\n")
+    # PDF extraction dominates the build: do it once for both sweeps
+    full_text = extract_text_from_pdf(pdf_path)
+    approved, forbidden = build_lexicons_from_text(full_text)
+    allcaps = all_caps_words_from_text(full_text)
 
-    with open(allcaps_path, "w", encoding="utf-8") as f:
-        for w in sorted(allcaps):
-            f.write(w + "\n")
+    write_wordlist(approved_path, approved)
+    write_wordlist(forbidden_path, forbidden)
+    write_wordlist(allcaps_path, allcaps)
 
     print(f"Built lexicons.\n  Approved  -> {approved_path} (count: {len(approved)})")
     print(f"  Forbidden -> {forbidden_path} (count: {len(forbidden)})")
     print(f"  ALL-CAPS  -> {allcaps_path} (count: {len(allcaps)})")
 
-# ---------------------- Linter core ----------------------
-def load_wordlist(path: str) -> Set[str]:
+# ---------------------- Wordlist files ----------------------
+def _write_wordlist_cache(path: str, words: FrozenSet[str]) -> None:
+    """
+    Store the parsed wordlist as <path>.marshal, tagged with the mtime of the .txt file.
+    Best effort: a read-only folder just means no cache.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+        with open(path + ".marshal", "wb") as f:
+            f.write(marshal.dumps((mtime, words)))
+    except OSError:
+        pass
+
+def write_wordlist(path: str, words: Iterable[str]) -> None:
+    words = frozenset(words)  # written twice (.txt and .marshal); words may be a generator
+    with open(path, "w", encoding="utf-8") as f:
+        for w in sorted(words):
+            f.write(w + "\n")
+    _write_wordlist_cache(path, words)
+
+def load_wordlist(path: str) -> FrozenSet[str]:
+    """
+    Load a wordlist (one word per line). Uses <path>.marshal when it was written
+    for the current version of the .txt file, otherwise parses the text and refreshes it.
+    """
+    try:
+        with open(path + ".marshal", "rb") as f:
+            mtime, words = marshal.loads(f.read())
+        if mtime == os.stat(path).st_mtime_ns and isinstance(words, frozenset):
+            return words
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
     with open(path, "r", encoding="utf-8") as f:
-        return set(line.strip() for line in f if line.strip())
-
-def tokenize_words_with_spans(text: str) -> List[Tuple[str, int, int]]:
-    toks: List[Tuple[str, int, int]] = []
-    for m in re.finditer(r"[A-Za-z][A-Za-z0-9\-\/']*", text):
-        toks.append((m.group(0), m.start(), m.end()))
-    return toks
-
-def split_sentences_with_spans(text: str) -> List[Tuple[str, int, int]]:
-    sents: List[Tuple[str, int, int]] = []
-    start = 0
-    for m in re.finditer(r"([\.!\?])", text):
-        end = m.end()
-        chunk = text[start:end].strip()
-        if chunk:
-            sents.append((chunk, start, end))
-        start = end
-    if start < len(text):
-        chunk = text[start:].strip()
-        if chunk:
-            sents.append((chunk, start, len(text)))
-    return sents
+        words = frozenset(line.strip() for line in f if line.strip())
+    _write_wordlist_cache(path, words)
+    return words
+
+# ---------------------- Linter core ----------------------
+
+# One scanner for the whole lint pass. Each match is either a sentence terminator
+# or a word.
+LINT_SCAN_RE = re.compile(r"(?P<sent>[\.!\?])|(?P<word>[A-Za-z][A-Za-z0-9\-\/']*)")
+
+# Passive voice heuristic. Scanned separately and merged by position: a phrase can
+# start inside a word token ("is/was closed", "part-is removed").
+PASSIVE_RE = re.compile(r"\b(am|is|are|was|were|be|been|being)\s+\w+ed\b", re.IGNORECASE)
 
 def is_acronym(token: str) -> bool:
     return token.isupper() and sum(c.isalpha() for c in token) >= 2
 
-def lint_text(
+def load_lexicon(approved_path: str, forbidden_path: str, allcaps_path: str) -> Dict[str, str]:
+    """
+    Load the wordlists once into a single lookup table for lint_text:
+    lowercase word -> "A" (approved) or "F" (forbidden).
+    Effective approved = official approved + ALL-CAPS sweep.
+    Forbidden comes strictly from the official list and wins over approved.
+    """
+    lexicon = dict.fromkeys((w.lower() for w in load_wordlist(approved_path)), "A")
+    if os.path.exists(allcaps_path):
+        lexicon.update(dict.fromkeys((w.lower() for w in load_wordlist(allcaps_path)), "A"))
+    if os.path.exists(forbidden_path):
+        lexicon.update(dict.fromkeys((w.lower() for w in load_wordlist(forbidden_path)), "F"))
+    return lexicon
+
+def _sentence_issue(s_idx: int, s_start: int, s_end: int, n_words: int, max_sentence_words: int) -> Optional[Dict]:
+    if n_words <= max_sentence_words:
+        return None
+    return {
+        "type": "SentenceTooLong",
+        "message": f"Sentence has {n_words} words (>{max_sentence_words}).",
+        "sentence_index": s_idx,
+        "span": (s_start, s_end),
+        "suggestion": "Split into shorter sentences (<= 20 words)."
+    }
+
+def _passive_issue(text: str, m: re.Match) -> Dict:
+    return {
+        "type": 'PassiveVoice',
+        "message": f"Possible passive: '{text[m.start():m.end()]}'",
+        "span": (m.start(), m.end()),
+        "suggestion": "Use active voice where possible."
+    }
+
+def iter_issues(
     text: str,
-    approved_path: str,
-    forbidden_path: str,
-    allcaps_path: str,
+    lexicon: Dict[str, str],
     max_sentence_words: int = 20
-) -> List[Dict]:
-    # Effective approved = official approved + ALL-CAPS sweep (both lowercased for matching)
-    approved = set(w.lower() for w in load_wordlist(approved_path))
-    if os.path.exists(allcaps_path):
-        approved.update(w.lower() for w in load_wordlist(allcaps_path))
+) -> Iterator[Dict]:
+    """
+    Lint text in a single scan and yield issues as they are found, so memory does
+    not grow with the number of issues. Issues come out in text order; a
+    SentenceTooLong issue follows the word issues of its sentence.
+    """
+    s_idx = 0
+    s_start = 0
+    n_words = 0
+    passives = PASSIVE_RE.finditer(text)
+    pm = next(passives, None)
+    for m in LINT_SCAN_RE.finditer(text):
+        # Passive voice heuristic: phrases starting up to this match (one starting
+        # inside the previous word token comes out after that token's issue)
+        while pm is not None and pm.start() <= m.start():
+            yield _passive_issue(text, pm)
+            pm = next(passives, None)
+
+        if m.lastgroup == "sent":
+            issue = _sentence_issue(s_idx, s_start, m.end(), n_words, max_sentence_words)
+            if issue is not None:
+                yield issue
+            s_idx += 1
+            s_start = m.end()
+            n_words = 0
+            continue
 
-    # Forbidden strictly from official list only
-    forbidden = set()
-    if os.path.exists(forbidden_path):
-        forbidden = set(w.lower() for w in load_wordlist(forbidden_path))
-
-    issues: List[Dict] = []
-
-    # Sentence length
-    sentences = split_sentences_with_spans(text)
-    for s_idx, (sent, s_start, s_end) in enumerate(sentences):
-        words = [t for t, _, _ in tokenize_words_with_spans(sent)]
-        if len(words) > max_sentence_words:
-            issues.append({
-                "type": "SentenceTooLong",
-                "message": f"Sentence has {len(words)} words (>{max_sentence_words}).",
-                "sentence_index": s_idx,
-                "span": (s_start, s_end),
-                "suggestion": "Split into shorter sentences (<= 20 words)."
-            })
-
-    # Word checks
-    for tok, start, end in tokenize_words_with_spans(text):
-        low = tok.lower()
-        if low.isdigit() or len(low) < 3 or is_acronym(tok):
+        n_words += 1
+        tok = m.group("word")
+        start, end = m.span()
+
+        # Word checks: one table probe classifies forbidden / approved / unknown.
+        # A bulk map(lexicon.get, map(str.lower, tokens)) pass would need each
+        # sentence's tokens buffered first; measured, that is no faster than this.
+        kind = lexicon.get(tok.lower())
+        if kind == "A" or tok.isdigit() or len(tok) < 3 or is_acronym(tok):
             continue
 
-        if low in forbidden:
-            issues.append({
+        if kind == "F":
+            yield {
                 "type": "ForbiddenWord",
                 "message": f"Forbidden word: '{tok}'",
                 "span": (start, end),
                 "suggestion": "Replace with an approved alternative per ASD-STE100."
-            })
-            continue
-
-        if low not in approved:
-            issues.append({
+            }
+        else:
+            yield {
                 "type": "UnapprovedWord",
                 "message": f"Not in approved lexicon: '{tok}'",
                 "span": (start, end),
                 "suggestion": "Prefer an approved STE word or rephrase."
-            })
+            }
+
+    while pm is not None:
+        yield _passive_issue(text, pm)
+        pm = next(passives, None)
+
+    # Trailing text without a terminator
+    issue = _sentence_issue(s_idx, s_start, len(text), n_words, max_sentence_words)
+    if issue is not None:
+        yield issue
+
+def lint_text(
+    text: str,
+    lexicon: Dict[str, str],
+    max_sentence_words: int = 20
+) -> List[Dict]:
+    """
+    All issues of iter_issues as a list.
+    """
+    return list(iter_issues(text, lexicon, max_sentence_words))
+
+# ---------------------- Batch linting ----------------------
+# Per-process state for lint_files workers, set once by _init_worker
+_WORKER_LEXICON: Dict[str, str] = {}
+_WORKER_MAX_WORDS = 20
+
+def _init_worker(lexicon: Dict[str, str], max_sentence_words: int) -> None:
+    global _WORKER_LEXICON, _WORKER_MAX_WORDS
+    _WORKER_LEXICON = lexicon
+    _WORKER_MAX_WORDS = max_sentence_words
+
+def _lint_file(path: str) -> Tuple[str, List[Dict], str]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        return path, [], str(e)
+    return path, list(iter_issues(text, _WORKER_LEXICON, _WORKER_MAX_WORDS)), ""
 
-    # Passive voice heuristic
-    for m in re.finditer(r"\b(am|is|are|was|were|be|been|being)\s+\w+ed\b", text, flags=re.IGNORECASE):
-        issues.append({
-            "type": 'PassiveVoice',
-            "message": f"Possible passive: '{text[m.start():m.end()]}'",
-            "span": (m.start(), m.end()),
-            "suggestion": "Use active voice where possible."
-        })
+def find_text_files(folder: str) -> List[str]:
+    """
+    All .txt files below folder (recursive), sorted for stable output.
+    """
+    out: List[str] = []
+    for root, _, names in os.walk(folder):
+        out.extend(os.path.join(root, n) for n in names if n.lower().endswith(".txt"))
+    return sorted(out)
+
+def lint_files(
+    paths: List[str],
+    lexicon: Dict[str, str],
+    max_sentence_words: int = 20,
+    jobs: int = 1
+) -> Iterator[Tuple[str, List[Dict], str]]:
+    """
+    Lint many files and yield (path, issues, error) in input order; error is "" on success.
+    With jobs > 1 the files are spread over a process pool. The lexicon is sent to
+    each worker once via the pool initializer instead of reloading the wordlists.
+    """
+    if jobs <= 1 or len(paths) <= 1:
+        _init_worker(lexicon, max_sentence_words)
+        yield from map(_lint_file, paths)
+        return
 
-    return issues
+    with Pool(min(jobs, len(paths)), initializer=_init_worker,
+              initargs=(lexicon, max_sentence_words)) as pool:
+        yield from pool.imap(_lint_file, paths)
 
 # ---------------------- CLI ----------------------
+REPORT_FIELDS = ["type","message","span","sentence_index","suggestion"]
+
+def report_row(i: Dict) -> Dict:
+    return {f: i.get(f, "") for f in REPORT_FIELDS}
+
+def print_issue(i: Dict) -> None:
+    line = f"[{i['type']}] {i['message']} @ {i.get('span','')}"
+    if "sentence_index" in i:
+        line += f" (sentence_index={i['sentence_index']})"
+    print(line)
+    print(f"  suggestion: {i['suggestion']}")
+
 def main():
     p = argparse.ArgumentParser(description="ASD-STE100 (Issue 9) simple linter")
     p.add_argument("--text", type=str, help="Text to lint (direct input).")
     p.add_argument("--file", type=str, help="Path to a text file to lint.")
+    p.add_argument("--folder", type=str, help="Lint all .txt files in a folder (recursive).")
+    p.add_argument("--jobs", type=int,
+                   help="Worker processes for --folder (default: 1, 0 = one per CPU).")
     p.add_argument("--approved", type=str, default=APPROVED_PATH,
                    help="Approved words list path (default: script folder).")
     p.add_argument("--forbidden", type=str, default=FORBIDDEN_PATH,
@@ -339,6 +483,11 @@ def main():
     p.add_argument("--rebuild", action="store_true",
                    help="Force rebuild lexicons from PDF before linting.")
     args = p.parse_args()
+    if args.jobs is not None:
+        if not args.folder:
+            p.error("--jobs only applies to --folder")
+        if args.jobs < 0:
+            p.error("--jobs must be 0 (one per CPU) or a positive number")
 
     # Pick PDF path (CLI overrides constant)
     pdf_path = args.pdf if args.pdf else PDF_PATH
@@ -347,43 +496,67 @@ def main():
     if args.rebuild or not (os.path.exists(args.approved) and os.path.exists(args.forbidden) and os.path.exists(args.allcaps)):
         ensure_wordlists(args.approved, args.forbidden, args.allcaps, pdf_path)
 
-    if not args.text and not args.file:
-        print("Provide --text or --file. (Use --rebuild to regenerate wordlists from the PDF if needed.)")
+    if not args.text and not args.file and not args.folder:
+        print("Provide --text, --file or --folder. (Use --rebuild to regenerate wordlists from the PDF if needed.)")
         print(f"Approved list:  {args.approved}")
         print(f"Forbidden list: {args.forbidden}")
         print(f"ALL-CAPS list:  {args.allcaps}")
         sys.exit(0)
 
-    text = args.text or ""
-    if args.file:
-        with open(args.file, "r", encoding="utf-8") as f:
-            text = f.read()
-
-    issues = lint_text(text, args.approved, args.forbidden, args.allcaps, args.max_sentence_words)
+    if args.folder:
+        if not os.path.isdir(args.folder):
+            print(f"Not a folder: {args.folder}")
+            sys.exit(2)
+        files = find_text_files(args.folder)
+    else:
+        text = args.text or ""
+        if args.file:
+            with open(args.file, "r", encoding="utf-8") as f:
+                text = f.read()
 
-    # Console output
-    for i in issues[:200]:
-        line = f"[{i['type']}] {i['message']} @ {i.get('span','')}"
-        if "sentence_index" in i:
-            line += f" (sentence_index={i['sentence_index']})"
-        print(line)
-        print(f"  suggestion: {i['suggestion']}")
+    lexicon = load_lexicon(args.approved, args.forbidden, args.allcaps)
 
-    print(f"\nTotal issues: {len(issues)}")
+    # Stream issues: print the first 200 (per file) and write every one to the CSV as it comes
+    report = open(args.report, "w", encoding="utf-8", newline="") if args.report else None
+    try:
+        writer = None
+        if report is not None:
+            writer = csv.DictWriter(report, fieldnames=(["file"] if args.folder else []) + REPORT_FIELDS)
+            writer.writeheader()
 
-    # Optional CSV report
+        total = 0
+        linted = skipped = 0
+        if args.folder:
+            jobs = 1 if args.jobs is None else (args.jobs or os.cpu_count() or 1)
+            for path, issues, err in lint_files(files, lexicon, args.max_sentence_words, jobs):
+                if err:
+                    print(f"[WARN] Skipped '{path}': {err}")
+                    skipped += 1
+                    continue
+                linted += 1
+                print(f"=== {path} ({len(issues)} issues)")
+                for i in issues[:200]:
+                    print_issue(i)
+                total += len(issues)
+                if writer is not None:
+                    for i in issues:
+                        writer.writerow({"file": path, **report_row(i)})
+        else:
+            for i in iter_issues(text, lexicon, args.max_sentence_words):
+                if total < 200:
+                    print_issue(i)
+                total += 1
+                if writer is not None:
+                    writer.writerow(report_row(i))
+    finally:
+        if report is not None:
+            report.close()
+
+    if args.folder:
+        print(f"\nTotal issues: {total} in {linted} file(s)" + (f" ({skipped} skipped)" if skipped else ""))
+    else:
+        print(f"\nTotal issues: {total}")
     if args.report:
-        with open(args.report, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=["type","message","span","sentence_index","suggestion"])
-            writer.writeheader()
-            for i in issues:
-                writer.writerow({
-                    "type": i.get("type",""),
-                    "message": i.get("message",""),
-                    "span": i.get("span",""),
-                    "sentence_index": i.get("sentence_index",""),
-                    "suggestion": i.get("suggestion",""),
-                })
         print(f"Report written to {args.report}")
 
 if __name__ == "__main__":
@@ -1,17 +1,41 @@
 import argparse
+import functools
+import hashlib
+import importlib.metadata
 import math
+import mmap
 import os
+import re
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Iterable, Tuple, Optional, List
 
-from transformers import AutoTokenizer
-from pypdf import PdfReader
+# transformers is imported lazily (load_tokenizer / count_tokens_batch): read_many's
+# worker processes import this module under spawn (Windows/macOS) and only read files
+
+try:
+    import blake3  # optional, faster hashing for the token cache
+except ImportError:
+    blake3 = None
+
+try:
+    import charset_normalizer  # optional, encoding detection for non-UTF-8 .txt files
+except ImportError:
+    charset_normalizer = None
+
+CACHE_DIR = Path.home() / ".cache" / "token_counter"
+
+# Let the Rust tokenizer spread encode_batch over all cores (user setting wins)
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
 
 
 def load_tokenizer(model_name: str):
     """
     Load the Qwen tokenizer (or any HF tokenizer) by model name.
     """
+    from transformers import AutoTokenizer
+
     try:
         tokenizer = AutoTokenizer.from_pretrained(model_name, trust_remote_code=True)
     except Exception as e:
@@ -31,33 +55,113 @@ def iter_folder_files(folder: Path) -> Iterable[Path]:
             yield p
 
 
-def read_text_file(path: Path, encoding_candidates: Optional[List[str]] = None) -> str:
+# charset_normalizer guesses confidently wrong on short input (b"caf\xe9 na\xefve" -> cp1006)
+_DETECT_MIN_BYTES = 1024
+_DETECT_MAX_CHAOS = 0.1
+
+
+def _detect_encoding(prefix: bytes) -> Optional[str]:
     """
-    Read text from a .txt file trying a few encodings.
+    charset_normalizer's guess for the encoding of prefix, or None if it is unavailable,
+    the prefix is too short, or the best match is ASCII or not clean enough.
     """
-    if encoding_candidates is None:
-        encoding_candidates = ["utf-8", "utf-16", "latin-1"]
-
-    last_err = None
-    for enc in encoding_candidates:
-        try:
-            return path.read_text(encoding=enc, errors="strict")
-        except Exception as e:
-            last_err = e
-    # fallback with replacement to avoid crash
-    return path.read_text(encoding="utf-8", errors="replace")
+    if charset_normalizer is None or len(prefix) < _DETECT_MIN_BYTES:
+        return None
+    best = charset_normalizer.from_bytes(prefix).best()
+    if best is None or best.encoding == "ascii" or best.chaos > _DETECT_MAX_CHAOS:
+        return None
+    return best.encoding
 
 
-def read_pdf_text(path: Path) -> str:
+def read_text_file(path: Path, encoding_candidates: Optional[List[str]] = None) -> str:
     """
-    Extract text from a PDF using pypdf.
-    Note: Scanned/image PDFs won’t yield text (OCR required).
+    Read text from a .txt file, decoding straight from a memory map.
+    UTF-8 (and UTF-16 with BOM), then cp1252 are tried first. Only if those fail is the
+    encoding charset_normalizer detects on a 64 KiB prefix used, then latin-1,
+    so no bytes are replaced. If encoding_candidates is given, those encodings are
+    tried in order instead. Line endings are normalized to LF, as in a text-mode read.
     """
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as data:
+            candidates = encoding_candidates
+            if candidates is None:
+                candidates = ["utf-8"]
+                if mm[:2] in (b"\xff\xfe", b"\xfe\xff"):
+                    candidates.append("utf-16")
+                candidates.append("cp1252")
+            text = None
+            for enc in candidates:
+                try:
+                    text = str(data, enc, "strict")
+                    break
+                except (UnicodeDecodeError, LookupError):
+                    pass
+            if text is None and encoding_candidates is None:
+                # Bytes cp1252 leaves undefined: a confident guess, else latin-1 (decodes anything)
+                enc = _detect_encoding(mm[:65536])
+                try:
+                    text = str(data, enc or "latin-1", "strict")
+                except (UnicodeDecodeError, LookupError):
+                    text = str(data, "latin-1", "strict")
+            if text is None:
+                # fallback with replacement to avoid crash
+                text = str(data, "utf-8", "replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _read_pdf_pdfium(path: Path, pdfium) -> str:
+    try:
+        pdf = pdfium.PdfDocument(str(path))
+    except Exception as e:
+        raise RuntimeError(f"Failed to open PDF '{path}': {e}")
+
+    texts = []
+    try:
+        for i, page in enumerate(pdf):
+            try:
+                textpage = page.get_textpage()
+                # pdfium reports line breaks as CRLF; normalize like the other backends
+                texts.append(textpage.get_text_range().replace("\r\n", "\n"))
+                textpage.close()
+            except Exception as e:
+                raise RuntimeError(f"Failed to extract text from page {i+1} in '{path}': {e}")
+            finally:
+                page.close()
+    finally:
+        pdf.close()
+    return "\n".join(texts)
+
+
+def _read_pdf_fitz(path: Path, fitz) -> str:
+    try:
+        doc = fitz.open(str(path))
+    except Exception as e:
+        raise RuntimeError(f"Failed to open PDF '{path}': {e}")
+
+    texts = []
+    with doc:
+        for i, page in enumerate(doc):
+            try:
+                texts.append(page.get_text() or "")
+            except Exception as e:
+                raise RuntimeError(f"Failed to extract text from page {i+1} in '{path}': {e}")
+    return "\n".join(texts)
+
+
+def _read_pdf_pypdf(path: Path) -> str:
+    from pypdf import PdfReader
+
     try:
         reader = PdfReader(str(path))
     except Exception as e:
         raise RuntimeError(f"Failed to open PDF '{path}': {e}")
 
+    # Pages are decoded sequentially on purpose: a PdfReader is not thread-safe
+    # (shared object-stream state fails with "Circular object-stream reference"),
+    # and one reader per thread is slower, since extract_text is GIL-bound Python.
+    # Folder mode already spreads PDFs over processes (read_many).
     texts = []
     for i, page in enumerate(reader.pages):
         try:
@@ -68,6 +172,39 @@ def read_pdf_text(path: Path) -> str:
     return "\n".join(texts)
 
 
+@functools.lru_cache(maxsize=None)
+def _pdf_backend():
+    """
+    The PDF text backend read_pdf_text uses, as (name, module): pypdfium2, then
+    PyMuPDF (fitz), then pypdf (module None, imported when a PDF is read).
+    """
+    try:
+        import pypdfium2 as pdfium
+        return "pypdfium2", pdfium
+    except ImportError:
+        pass
+    try:
+        import fitz
+        return "PyMuPDF", fitz
+    except ImportError:
+        pass
+    return "pypdf", None
+
+
+def read_pdf_text(path: Path) -> str:
+    """
+    Extract text from a PDF with the fastest installed backend:
+    pypdfium2, then PyMuPDF (fitz), both C/C++ based, then pure-Python pypdf.
+    Note: Scanned/image PDFs won’t yield text (OCR required).
+    """
+    name, module = _pdf_backend()
+    if name == "pypdfium2":
+        return _read_pdf_pdfium(path, module)
+    if name == "PyMuPDF":
+        return _read_pdf_fitz(path, module)
+    return _read_pdf_pypdf(path)
+
+
 def read_any(path: Path) -> str:
     if path.suffix.lower() == ".txt":
         return read_text_file(path)
@@ -77,6 +214,34 @@ def read_any(path: Path) -> str:
         raise ValueError(f"Unsupported file type: {path.suffix}")
 
 
+def read_many(paths: List[Path]) -> List[Tuple[Path, str]]:
+    """
+    Read many files and return (path, text) pairs; files that fail are skipped with a warning.
+    PDF extraction is CPU-bound pure Python, so PDFs are extracted in worker processes
+    (a pool is only started when there is more than one PDF).
+    """
+    pdfs = [p for p in paths if p.suffix.lower() == ".pdf"]
+    use_pool = len(pdfs) > 1
+    inline = [p for p in paths if p.suffix.lower() != ".pdf"] if use_pool else list(paths)
+
+    results: List[Tuple[Path, str]] = []
+    for p in inline:
+        try:
+            results.append((p, read_any(p)))
+        except Exception as e:
+            print(f"[WARN] Skipped '{p}': {e}")
+
+    if use_pool:
+        with ProcessPoolExecutor(max_workers=min(len(pdfs), os.cpu_count() or 1)) as ex:
+            futs = {ex.submit(read_any, p): p for p in pdfs}
+            for f in as_completed(futs):
+                try:
+                    results.append((futs[f], f.result()))
+                except Exception as e:
+                    print(f"[WARN] Skipped '{futs[f]}': {e}")
+    return results
+
+
 def count_tokens_str(text: str, tokenizer) -> int:
     """
     Count tokens for a given text using the provided tokenizer.
@@ -86,9 +251,175 @@ def count_tokens_str(text: str, tokenizer) -> int:
     return len(tokenizer.encode(text))
 
 
-def count_tokens_file(path: Path, tokenizer) -> Tuple[Path, int]:
+def _counting_backend(tokenizer):
+    """
+    The Rust backend of a fast tokenizer, set up for counting, or None for slow tokenizers.
+    """
+    from transformers import PreTrainedTokenizerFast
+
+    if not isinstance(tokenizer, PreTrainedTokenizerFast):
+        return None
+    bt = tokenizer.backend_tokenizer
+    # tokenizer.json may carry truncation/padding; they would change the counts
+    bt.no_truncation()
+    bt.no_padding()
+    return bt
+
+
+def count_tokens_batch(texts: List[str], tokenizer, batch_size: int = 64) -> List[int]:
+    """
+    Count tokens for many texts, giving the same counts as count_tokens_str.
+    Fast (Rust) tokenizers encode each sub-batch with backend encode_batch, which
+    runs in parallel outside the GIL; slow (Python) tokenizers count one by one.
+    batch_size bounds how many encodings are held in memory at once.
+    """
+    bt = _counting_backend(tokenizer)
+    if bt is None:
+        return [count_tokens_str(t, tokenizer) for t in texts]
+
+    # Batch texts of similar length together so the parallel workers of one
+    # encode_batch call finish at about the same time; counts keep input order
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    counts = [0] * len(texts)
+    for start in range(0, len(order), batch_size):
+        idx = order[start:start + batch_size]
+        encodings = bt.encode_batch([texts[i] for i in idx], add_special_tokens=True)
+        for i, e in zip(idx, encodings):
+            counts[i] = len(e.ids)
+    return counts
+
+
+# Bump when read_text_file or the PDF readers change the text a file yields, so
+# token counts cached under the old rules are not reused
+TEXT_FORMAT_VERSION = 2
+
+
+@functools.lru_cache(maxsize=None)
+def _dist_version(dist: str) -> str:
+    try:
+        return importlib.metadata.version(dist)
+    except importlib.metadata.PackageNotFoundError:
+        return "?"
+
+
+def extractor_tag(path: Path) -> str:
+    """
+    Identify how the text of a file is produced (format version plus the backend
+    and its version), so the token cache only reuses counts from the same extractor.
+    """
+    if path.suffix.lower() == ".pdf":
+        name = _pdf_backend()[0]
+        return f"v{TEXT_FORMAT_VERSION}:{name}={_dist_version(name)}"
+    if charset_normalizer is not None:
+        return f"v{TEXT_FORMAT_VERSION}:charset_normalizer={_dist_version('charset_normalizer')}"
+    return f"v{TEXT_FORMAT_VERSION}"
+
+
+def tokenizer_fingerprint(tokenizer) -> bytes:
+    """
+    Hash what the tokenizer is rather than what it is called, for the token cache:
+    the serialized backend of a fast tokenizer, else class, vocabulary and special tokens.
+    """
+    bt = _counting_backend(tokenizer)
+    if bt is not None:
+        data = bt.to_str()
+    else:
+        data = repr((type(tokenizer).__name__, sorted(tokenizer.get_vocab().items()),
+                     tokenizer.special_tokens_map))
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).digest()
+
+
+def open_cache(model_name: str) -> Optional[sqlite3.Connection]:
+    """
+    Open (or create) the token-count cache for a tokenizer:
+    ~/.cache/token_counter/{model_slug}.sqlite, mapping file hash -> token count.
+    The slug only groups entries; file_digest keys them on the tokenizer fingerprint.
+    Returns None (with a warning) if the cache cannot be opened.
+    """
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "_", model_name).strip("_")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache = sqlite3.connect(str(CACHE_DIR / f"{slug}.sqlite"))
+        cache.execute("CREATE TABLE IF NOT EXISTS tc(h BLOB PRIMARY KEY, n INTEGER)")
+    except (OSError, sqlite3.Error) as e:
+        print(f"[WARN] Token cache disabled: {e}")
+        return None
+    return cache
+
+
+def file_digest(path: Path, fingerprint: bytes) -> bytes:
+    """
+    Hash the tokenizer fingerprint, the extractor tag and the raw file bytes
+    (blake3 if installed, else blake2b) for the token cache.
+    """
+    tag = fingerprint + extractor_tag(path).encode()
+    data = path.read_bytes()
+    if blake3 is not None:
+        h = blake3.blake3(tag)
+        h.update(b"\0")
+        h.update(data)
+        return h.digest(length=16)
+    h = hashlib.blake2b(tag, digest_size=16)
+    h.update(b"\0")
+    h.update(data)
+    return h.digest()
+
+
+def cache_get(cache: sqlite3.Connection, h: bytes) -> Optional[int]:
+    row = cache.execute("SELECT n FROM tc WHERE h=?", (h,)).fetchone()
+    return row[0] if row else None
+
+
+def cache_put(cache: sqlite3.Connection, h: bytes, n: int) -> None:
+    cache.execute("INSERT OR REPLACE INTO tc(h, n) VALUES (?, ?)", (h, n))
+
+
+def count_tokens_file(path: Path, tokenizer, cache: Optional[sqlite3.Connection] = None) -> Tuple[Path, int]:
+    h = file_digest(path, tokenizer_fingerprint(tokenizer)) if cache is not None else None
+    if h is not None:
+        n = cache_get(cache, h)
+        if n is not None:
+            return path, n
+
     text = read_any(path)
-    return path, count_tokens_str(text, tokenizer)
+    n = count_tokens_str(text, tokenizer)
+    if h is not None:
+        cache_put(cache, h, n)
+    return path, n
+
+
+def count_tokens_folder(paths: List[Path], tokenizer, cache: Optional[sqlite3.Connection] = None) -> List[Tuple[Path, int]]:
+    """
+    Count tokens for many files. Cached files are answered from their content hash;
+    only the rest are read and batch-tokenized. Unreadable files are skipped with a warning.
+    """
+    counts: List[Tuple[Path, int]] = []
+    digests = {}
+    misses = paths
+    if cache is not None:
+        misses = []
+        fingerprint = tokenizer_fingerprint(tokenizer)
+        for p in paths:
+            try:
+                digests[p] = file_digest(p, fingerprint)
+            except OSError:
+                # Leave it to read_many to report the file
+                misses.append(p)
+                continue
+            n = cache_get(cache, digests[p])
+            if n is None:
+                misses.append(p)
+            else:
+                counts.append((p, n))
+
+    # Pass 1: read the remaining files; pass 2: tokenize them in batches
+    read = read_many(misses)
+    fresh = list(zip([p for p, _ in read], count_tokens_batch([t for _, t in read], tokenizer)))
+    if cache is not None:
+        for p, n in fresh:
+            if p in digests:
+                cache_put(cache, digests[p], n)
+    return counts + fresh
 
 
 def parse_margin(value: Optional[str]) -> float:
@@ -143,10 +474,16 @@ def main():
         help="Optional percentage margin to approximate other models' counts. "
              "Examples: --margin 5  (5%), --margin 10%%, --margin 0.05."
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the token-count cache in ~/.cache/token_counter."
+    )
     args = parser.parse_args()
 
     # Load tokenizer
     tokenizer = load_tokenizer(args.tokenizer)
+    cache = None if args.no_cache else open_cache(args.tokenizer)
 
     grand_total = 0
     any_output = False
@@ -172,7 +509,7 @@ def main():
             raise FileNotFoundError(f"File not found: {p}")
         if p.suffix.lower() not in {".txt", ".pdf"}:
             raise ValueError("Only .txt and .pdf are supported for --file.")
-        path, n = count_tokens_file(p, tokenizer)
+        path, n = count_tokens_file(p, tokenizer, cache)
         print_with_margin("[FILE]", str(path), n)
         grand_total += n
         any_output = True
@@ -181,14 +518,8 @@ def main():
         folder = Path(args.folder)
         if not folder.exists() or not folder.is_dir():
             raise NotADirectoryError(f"Not a folder: {folder}")
-        counts = []
-        for p in iter_folder_files(folder):
-            try:
-                path, n = count_tokens_file(p, tokenizer)
-                counts.append((path, n))
-                grand_total += n
-            except Exception as e:
-                print(f"[WARN] Skipped '{p}': {e}")
+        counts = count_tokens_folder(list(iter_folder_files(folder)), tokenizer, cache)
+        grand_total += sum(n for _, n in counts)
 
         # Sort by path for stable output
         counts.sort(key=lambda x: str(x[0]).lower())
@@ -196,6 +527,10 @@ def main():
             print_with_margin("[FOLDER]", str(path), n)
         any_output = True
 
+    if cache is not None:
+        cache.commit()
+        cache.close()
+
     if not any_output:
         parser.error("Please provide at least one of --text, --file, or --folder.")
 